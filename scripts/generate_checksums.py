@@ -1,63 +1,116 @@
 #!/usr/bin/env python3
 """
-Generate SHA-256 checksums for all data files.
+Generate checksums for all data files (SHA-256 by default, or BLAKE3).
 
 Creates a manifest file with checksums for verification.
+
+The manifest records the hash "algorithm"; each entry records the digest
+under that algorithm's name, "size" (bytes) and "modified" (the local
+modification time as an ISO-8601 string).
 """
 
-import hashlib
+import argparse
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def calculate_sha256(file_path: Path) -> str:
-    """Calculate SHA-256 checksum of a file."""
-    sha256_hash = hashlib.sha256()
-    
-    with open(file_path, "rb") as f:
-        # Read in 64kb chunks
-        for byte_block in iter(lambda: f.read(65536), b""):
-            sha256_hash.update(byte_block)
-    
-    return sha256_hash.hexdigest()
+from hash_utils import (
+    DEFAULT_ALGORITHM,
+    PREFETCH_MIN_SIZE,
+    SUPPORTED_ALGORITHMS,
+    HashCache,
+    calculate_digest,
+    get_hasher,
+    iter_files,
+    prefetch,
+)
+
+# Extensions to include
+EXTENSIONS = (".json", ".csv", ".png", ".svg")
+
+# Directories to exclude (temporary/cache files); pruned during the walk
+EXCLUDE_DIRS = frozenset({"htmlcov", "quality", "__pycache__", ".pytest_cache"})
+
+# Number of per-file progress lines buffered before writing to stdout
+PROGRESS_BATCH = 1024
 
 
-def generate_checksums(data_dir: Path) -> Dict:
-    """Generate checksums for all data files."""
+def generate_checksums(data_dir: Path, hash_cache: Optional[HashCache] = None,
+                       algorithm: str = DEFAULT_ALGORITHM) -> Dict:
+    """Generate checksums for all data files.
+    
+    Files whose size and mtime match an entry in ``hash_cache`` are not
+    re-hashed; the remaining files are hashed across worker processes.
+    """
     checksums = {}
     file_count = 0
     
-    # Patterns to include
-    patterns = ["*.json", "*.csv", "*.png", "*.svg"]
-    
-    # Directories to exclude (temporary/cache files)
-    exclude_dirs = {"htmlcov", "quality", "__pycache__", ".pytest_cache"}
-    
-    for pattern in patterns:
-        for file_path in data_dir.rglob(pattern):
-            # Skip if in excluded directory
-            if any(excluded in file_path.parts for excluded in exclude_dirs):
-                continue
-                
-            if file_path.is_file():
-                relative_path = file_path.relative_to(data_dir)
-                checksum = calculate_sha256(file_path)
-                
-                checksums[str(relative_path)] = {
-                    "sha256": checksum,
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(
-                        file_path.stat().st_mtime
-                    ).isoformat()
-                }
-                
-                file_count += 1
-                print(f"✓ {relative_path}: {checksum[:16]}...")
+    # Collect files first (one tree walk) so hashing can be spread across worker processes
+    entries: List[Tuple[Path, os.stat_result]] = [
+        (Path(path), stat)
+        for path, stat in iter_files(data_dir, EXTENSIONS, EXCLUDE_DIRS)
+    ]
+    
+    digests: Dict[Path, str] = {}
+    if hash_cache is not None:
+        for file_path, stat in entries:
+            cached = hash_cache.lookup(file_path, stat, algorithm)
+            if cached is not None:
+                digests[file_path] = cached
+    
+    pending = [(file_path, stat) for file_path, stat in entries if file_path not in digests]
+    if os.name == "posix":
+        # Inode order approximates on-disk order, turning seeks into sequential reads
+        pending.sort(key=lambda entry: entry[1].st_ino)
+    
+    # Queue readahead for large files so the disk stays busy while workers hash
+    for file_path, stat in pending:
+        if stat.st_size >= PREFETCH_MIN_SIZE:
+            prefetch(file_path)
+    
+    to_hash = [file_path for file_path, _ in pending]
+    
+    if to_hash:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            hash_file = partial(calculate_digest, algorithm=algorithm)
+            digests.update(zip(to_hash, executor.map(hash_file, to_hash, chunksize=16)))
+    
+    # Progress lines are written in batches rather than one print() per file
+    progress: List[str] = []
+    for file_path, stat in entries:
+        checksum = digests[file_path]
+        if hash_cache is not None:
+            hash_cache.store(file_path, stat, checksum, algorithm)
+        
+        relative_path = file_path.relative_to(data_dir)
+        
+        checksums[str(relative_path)] = {
+            algorithm: checksum,
+            "size": stat.st_size,
+            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
+        }
+        
+        file_count += 1
+        progress.append(f"✓ {relative_path}: {checksum[:16]}...\n")
+        if len(progress) >= PROGRESS_BATCH:
+            sys.stdout.write("".join(progress))
+            progress.clear()
+    
+    sys.stdout.write("".join(progress))
     
     return {
         "generated": datetime.now().isoformat(),
+        "algorithm": algorithm,
         "total_files": file_count,
         "checksums": checksums
     }
@@ -65,8 +118,12 @@ def generate_checksums(data_dir: Path) -> Dict:
 
 def save_manifest(manifest: Dict, output_file: Path):
     """Save checksum manifest to file."""
-    with open(output_file, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    if orjson is not None:
+        # Serialized (indent included) in C straight to bytes
+        output_file.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(manifest, f, indent=2)
     
     print(f"\n✓ Manifest saved to: {output_file}")
 
@@ -78,16 +135,45 @@ def generate_verification_script(manifest_file: Path):
 
 import hashlib
 import json
+import mmap
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def calculate_sha256(file_path):
-    sha256_hash = hashlib.sha256()
+def get_hasher(algorithm):
+    if algorithm == "blake3":
+        import blake3
+        return blake3.blake3
+    return getattr(hashlib, algorithm)
+
+
+# Files at least this large are hashed from a memory map, 16 MiB per update
+MMAP_MIN_SIZE = 64 << 20
+MMAP_UPDATE_SIZE = 16 << 20
+
+
+def digest_mmap(f, hasher):
+    file_hash = hasher()
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise"):
+            try:
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            except (AttributeError, OSError):
+                pass
+        with memoryview(mm) as view:
+            for offset in range(0, len(view), MMAP_UPDATE_SIZE):
+                file_hash.update(view[offset:offset + MMAP_UPDATE_SIZE])
+    return file_hash.hexdigest()
+
+
+def calculate_digest(file_path, algorithm="sha256"):
+    hasher = get_hasher(algorithm)
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(65536), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            return digest_mmap(f, hasher)
+        return hashlib.file_digest(f, hasher).hexdigest()
 
 
 def verify_checksums(manifest_file, data_dir):
@@ -95,29 +181,44 @@ def verify_checksums(manifest_file, data_dir):
         manifest = json.load(f)
     
     checksums = manifest["checksums"]
+    algorithm = manifest.get("algorithm", "sha256")
     total = len(checksums)
     verified = 0
     failed = []
     
     print(f"Verifying {total} files...")
     
-    for rel_path, info in checksums.items():
+    def check(item):
+        rel_path, info = item
         file_path = data_dir / rel_path
-        
-        if not file_path.exists():
-            print(f"✗ Missing: {rel_path}")
-            failed.append((rel_path, "missing"))
-            continue
-        
-        actual_checksum = calculate_sha256(file_path)
-        expected_checksum = info["sha256"]
-        
-        if actual_checksum == expected_checksum:
-            verified += 1
-            print(f"✓ {rel_path}")
-        else:
-            print(f"✗ Checksum mismatch: {rel_path}")
-            failed.append((rel_path, "mismatch"))
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            return rel_path, "missing"
+        # A size differing from the manifest is a guaranteed checksum
+        # mismatch: reported without reading the file
+        if "size" in info and size != info["size"]:
+            return rel_path, "size mismatch"
+        actual_checksum = calculate_digest(file_path, algorithm)
+        expected_checksum = info[algorithm]
+        return rel_path, None if actual_checksum == expected_checksum else "mismatch"
+    
+    # Files are hashed concurrently (hashing releases the GIL); results are
+    # reported in manifest order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for rel_path, problem in executor.map(check, checksums.items()):
+            if problem is None:
+                verified += 1
+                print(f"✓ {rel_path}")
+            elif problem == "missing":
+                print(f"✗ Missing: {rel_path}")
+                failed.append((rel_path, problem))
+            elif problem == "size mismatch":
+                print(f"✗ Size mismatch: {rel_path}")
+                failed.append((rel_path, problem))
+            else:
+                print(f"✗ Checksum mismatch: {rel_path}")
+                failed.append((rel_path, problem))
     
     print(f"\\nResults: {verified}/{total} verified")
     
@@ -152,22 +253,37 @@ def verify_checksums(manifest_file, data_dir):
 
 def main():
     """Main entry point."""
-    import sys
+    parser = argparse.ArgumentParser(description="Generate checksums for data files")
+    parser.add_argument("data_dir", nargs="?", default="results",
+                        help="Directory to scan (default: results)")
+    parser.add_argument("--algorithm", choices=SUPPORTED_ALGORITHMS, default=DEFAULT_ALGORITHM,
+                        help="Hash algorithm; blake3 is faster but needs the blake3 package "
+                             "(default: sha256)")
+    args = parser.parse_args()
     
-    data_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("results")
+    data_dir = Path(args.data_dir)
     
     if not data_dir.exists():
         print(f"Error: {data_dir} does not exist")
         sys.exit(1)
     
+    try:
+        get_hasher(args.algorithm)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
     print("=" * 60)
     print("CHECKSUM GENERATOR")
     print("=" * 60)
     print(f"\nScanning: {data_dir}")
+    print(f"Algorithm: {args.algorithm}")
     print()
     
-    # Generate checksums
-    manifest = generate_checksums(data_dir)
+    # Generate checksums (unchanged files are served from the shared hash cache)
+    hash_cache = HashCache()
+    manifest = generate_checksums(data_dir, hash_cache, args.algorithm)
+    hash_cache.save()
     
     # Save manifest
     manifest_file = Path("CHECKSUMS.json")
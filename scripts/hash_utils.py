@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Shared file discovery and hashing helpers.
+
+Used by generate_checksums.py and validate_data.py so both tools walk the
+data tree and compute checksums through the same code path, and share one
+on-disk hash cache.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Callable, Collection, Dict, Iterator, Optional, Tuple, Union
+
+# Optional faster integrity hash (not a substitute where SHA-256 is mandated)
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Optional C JSON codec for the hash cache sidecar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Hash algorithms selectable with --algorithm; SHA-256 remains the default
+SUPPORTED_ALGORITHMS = ("sha256", "blake3")
+DEFAULT_ALGORITHM = "sha256"
+
+# Files at least this large are hashed from a memory map, 16 MiB per update
+MMAP_MIN_SIZE = 64 << 20
+MMAP_UPDATE_SIZE = 16 << 20
+
+# Files at least this large get an asynchronous readahead hint before hashing
+PREFETCH_MIN_SIZE = 8 << 20
+
+# Sidecar cache shared by the validator and the checksum generator
+DEFAULT_CACHE_FILE = Path(__file__).parent.parent / ".hash_cache.json"
+
+
+def iter_files(root: Union[str, Path], extensions: Tuple[str, ...],
+               exclude_dirs: Collection[str] = (),
+               recursive: bool = True) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield (path, stat) for files under root whose name ends with one of extensions.
+
+    Single os.scandir pass: directories named in exclude_dirs are never
+    descended into, and the stat comes from the DirEntry so callers need no
+    extra stat() calls.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and entry.name not in exclude_dirs:
+                        stack.append(entry.path)
+                elif entry.name.endswith(extensions) and entry.is_file():
+                    yield entry.path, entry.stat()
+
+
+def prefetch(file_path: Union[str, Path]):
+    """Ask the kernel to start reading a file into the page cache in the background.
+
+    Lets disk reads for queued files overlap with hashing of the current one.
+    No-op where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def get_hasher(algorithm: str = DEFAULT_ALGORITHM) -> Callable:
+    """Return the hash object constructor for an algorithm name."""
+    if algorithm == "sha256":
+        return hashlib.sha256
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ValueError("blake3 is not installed (pip install blake3)")
+        return blake3.blake3
+    raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+
+def digest_bytes(content: bytes, algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """Hex digest of an in-memory buffer."""
+    return get_hasher(algorithm)(content).hexdigest()
+
+
+def _digest_mmap(f, hasher: Callable) -> str:
+    """Hash an open file through a read-only memory map, without copying into userspace."""
+    file_hash = hasher()
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise"):
+            try:
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            except (AttributeError, OSError):
+                pass
+        with memoryview(mm) as view:
+            for offset in range(0, len(view), MMAP_UPDATE_SIZE):
+                file_hash.update(view[offset:offset + MMAP_UPDATE_SIZE])
+    return file_hash.hexdigest()
+
+
+def calculate_digest(file_path: Union[str, Path], algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """Calculate the checksum of a file with the given algorithm."""
+    hasher = get_hasher(algorithm)
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            return _digest_mmap(f, hasher)
+
+        # The read/update loop runs entirely in C
+        return hashlib.file_digest(f, hasher).hexdigest()
+
+
+def calculate_sha256(file_path: Union[str, Path]) -> str:
+    """Calculate SHA-256 checksum of a file."""
+    return calculate_digest(file_path, "sha256")
+
+
+class HashCache:
+    """Digest cache keyed on (absolute path, size, mtime_ns).
+
+    Entries are reused only while a file's size and mtime are unchanged,
+    so repeated validate/checksum runs hash each modified file once.
+    Each entry can hold one digest per algorithm. The cache is optional:
+    an unreadable, corrupt or unwritable cache file, or a malformed entry,
+    only costs a rehash.
+    """
+
+    def __init__(self, cache_file: Union[str, Path] = DEFAULT_CACHE_FILE):
+        self.cache_file = Path(cache_file)
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+
+        try:
+            if orjson is not None:
+                entries = orjson.loads(self.cache_file.read_bytes())
+            else:
+                with open(self.cache_file) as f:
+                    entries = json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable file, or invalid JSON/UTF-8 (the JSON
+            # decode errors of both codecs subclass ValueError)
+            entries = {}
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    @staticmethod
+    def _matches(entry, stat: os.stat_result) -> bool:
+        """Whether a cache entry was recorded for this size/mtime (False if malformed)."""
+        return (isinstance(entry, dict)
+                and entry.get("size") == stat.st_size
+                and entry.get("mtime_ns") == stat.st_mtime_ns)
+
+    def lookup(self, file_path: Union[str, Path], stat: os.stat_result,
+               algorithm: str = DEFAULT_ALGORITHM) -> Optional[str]:
+        """Return the cached digest if the file is unchanged, else None."""
+        entry = self._entries.get(os.path.abspath(file_path))
+        if self._matches(entry, stat):
+            digest = entry.get(algorithm)
+            if isinstance(digest, str):
+                return digest
+        return None
+
+    def store(self, file_path: Union[str, Path], stat: os.stat_result, digest: str,
+              algorithm: str = DEFAULT_ALGORITHM):
+        """Record the digest for the file's current size/mtime."""
+        key = os.path.abspath(file_path)
+        entry = self._entries.get(key)
+        if not self._matches(entry, stat):
+            # New or modified file: digests for other algorithms are stale
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            self._entries[key] = entry
+            self._dirty = True
+        if entry.get(algorithm) != digest:
+            entry[algorithm] = digest
+            self._dirty = True
+
+    def get_digest(self, file_path: Union[str, Path], content: Optional[bytes] = None,
+                   stat: Optional[os.stat_result] = None,
+                   algorithm: str = DEFAULT_ALGORITHM) -> str:
+        """Return the file's digest, hashing only on a cache miss.
+
+        If the caller already read or stat'ed the file, pass its bytes as
+        ``content`` and/or its ``stat`` to avoid touching the file again.
+        """
+        if stat is None:
+            stat = os.stat(file_path)
+        digest = self.lookup(file_path, stat, algorithm)
+        if digest is None:
+            if content is not None:
+                digest = digest_bytes(content, algorithm)
+            else:
+                digest = calculate_digest(file_path, algorithm)
+            self.store(file_path, stat, digest, algorithm)
+        return digest
+
+    def save(self):
+        """Persist the cache if anything changed (skipped if the file is unwritable)."""
+        if not self._dirty:
+            return
+        try:
+            if orjson is not None:
+                self.cache_file.write_bytes(orjson.dumps(self._entries))
+            else:
+                with open(self.cache_file, "w") as f:
+                    json.dump(self._entries, f)
+        except OSError:
+            return
+        self._dirty = False
@@ -14,19 +14,64 @@
 import sys
 import os
 import argparse
-import hashlib
+import importlib.util
+import io
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from hash_utils import (
+    DEFAULT_ALGORITHM,
+    SUPPORTED_ALGORITHMS,
+    HashCache,
+    calculate_digest,
+    digest_bytes,
+    get_hasher,
+    iter_files,
+)
+
+# pandas is only imported when a CSV is large enough to benefit
+_HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+
+# Optional fast JSON parser; falls back to the standard library
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Sentinel for absent keys (None is a legitimate JSON value)
+_MISSING = object()
+
+# Start time of the last fully valid run per resolved directory (used by --incremental)
+LAST_VALIDATED_FILE = Path(__file__).parent.parent / ".last_validated"
+
 
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+# A row-level CSV error as a (template, args) pair, formatted once per file
+# by CSVValidator.validate() rather than once per bad cell in the row loop
+Message = Tuple[str, tuple]
+
+# Row-level CSV error templates (corrupt files can yield many)
+ROW_EMPTY_VALUE = "Row {}: Empty value in column '{}'"
+ROW_NEGATIVE_VALUE = "Row {}: Negative value in '{}': {}"
+ROW_INVALID_NUMBER = "Row {}: Invalid numeric value in '{}': {}"
+
+
+def format_message(message: Message) -> str:
+    """Render a row-level error to text"""
+    template, args = message
+    return template.format(*args)
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Results from validation check"""
     valid: bool
@@ -43,15 +88,24 @@ class ValidationResult:
 class DataValidator(ABC):
     """Abstract base class for data validators"""
     
+    def __init__(self, hash_cache: Optional[HashCache] = None,
+                 algorithm: str = DEFAULT_ALGORITHM):
+        self.hash_cache = hash_cache
+        self.algorithm = algorithm
+    
     @abstractmethod
     def validate(self, file_path: str) -> ValidationResult:
         """Validate a data file"""
         pass
     
-    @abstractmethod
-    def get_checksum(self, file_path: str) -> str:
-        """Calculate file checksum"""
-        pass
+    def get_checksum(self, file_path: str, content: Optional[bytes] = None,
+                     stat: Optional[os.stat_result] = None) -> str:
+        """Calculate file checksum (SHA256 by default), from already-read content if given"""
+        if self.hash_cache is not None:
+            return self.hash_cache.get_digest(file_path, content, stat, self.algorithm)
+        if content is not None:
+            return digest_bytes(content, self.algorithm)
+        return calculate_digest(file_path, self.algorithm)
 
 
 # ============================================================================
@@ -61,30 +115,42 @@ def get_checksum(self, file_path: str) -> str:
 class JSONValidator(DataValidator):
     """Validator for JSON benchmark data files"""
     
-    def __init__(self, required_fields: Optional[List[str]] = None):
+    def __init__(self, required_fields: Optional[List[str]] = None,
+                 hash_cache: Optional[HashCache] = None,
+                 algorithm: str = DEFAULT_ALGORITHM):
+        super().__init__(hash_cache, algorithm)
         # Accept both old format (iterations, operations) and new format (results)
         self.required_fields = required_fields or ['algorithm']
     
+    # Statistical fields per entry in the 'results' array / legacy 'operations' dict
+    RESULT_STAT_FIELDS = ('mean_us', 'median_us', 'stddev_us', 'min_us', 'max_us')
+    OPERATION_STAT_FIELDS = ('min', 'max', 'mean', 'median', 'stddev')
+    
     def validate(self, file_path: str) -> ValidationResult:
         """Validate JSON file structure and content"""
         errors = []
         warnings = []
         
-        # Check file exists
-        if not Path(file_path).exists():
+        # Check file exists (this one stat also serves the size and cache checks)
+        try:
+            stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             errors.append(f"File not found: {file_path}")
             return ValidationResult(False, errors, warnings, file_path)
         
         # Check file is not empty
-        if Path(file_path).stat().st_size == 0:
+        if stat.st_size == 0:
             errors.append(f"File is empty: {file_path}")
             return ValidationResult(False, errors, warnings, file_path)
         
+        # Read once: the same bytes are parsed and hashed
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        
         # Try to parse JSON
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = _json_loads(content)
+        except (json.JSONDecodeError, ValueError) as e:
             errors.append(f"Invalid JSON: {e}")
             return ValidationResult(False, errors, warnings, file_path)
         
@@ -109,19 +175,17 @@ def validate(self, file_path: str) -> ValidationResult:
                 if 'operation' not in result:
                     warnings.append(f"Result {idx} missing 'operation' field")
                 
-                # Check for statistical fields
-                stat_fields = ['mean_us', 'median_us', 'stddev_us', 'min_us', 'max_us']
-                missing_stats = [f for f in stat_fields if f not in result]
+                # Check statistical fields are present and valid (one lookup per field)
+                missing_stats = []
+                for stat_field in self.RESULT_STAT_FIELDS:
+                    value = result.get(stat_field, _MISSING)
+                    if value is _MISSING:
+                        missing_stats.append(stat_field)
+                    elif not isinstance(value, (int, float)) or value < 0:
+                        errors.append(f"Invalid {stat_field} in result {idx}: {value}")
                 if missing_stats:
                     warnings.append(f"Result {idx} missing stats: {missing_stats}")
                 
-                # Validate numeric values
-                for stat_field in stat_fields:
-                    if stat_field in result:
-                        value = result[stat_field]
-                        if not isinstance(value, (int, float)) or value < 0:
-                            errors.append(f"Invalid {stat_field} in result {idx}: {value}")
-                
                 # Check num_samples
                 if 'num_samples' in result:
                     if not isinstance(result['num_samples'], int) or result['num_samples'] < 100:
@@ -134,24 +198,15 @@ def validate(self, file_path: str) -> ValidationResult:
                     errors.append(f"Operation '{op_name}' must be an object")
                     continue
                 
-                stat_fields = ['min', 'max', 'mean', 'median', 'stddev']
-                missing_stats = [f for f in stat_fields if f not in op_data]
+                missing_stats = [f for f in self.OPERATION_STAT_FIELDS if f not in op_data]
                 if missing_stats:
                     warnings.append(f"Operation '{op_name}' missing stats: {missing_stats}")
         
         # Calculate checksum
-        checksum = self.get_checksum(file_path)
+        checksum = self.get_checksum(file_path, content, stat)
         
         is_valid = len(errors) == 0
         return ValidationResult(is_valid, errors, warnings, file_path, checksum)
-    
-    def get_checksum(self, file_path: str) -> str:
-        """Calculate SHA256 checksum of file"""
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
 
 
 # ============================================================================
@@ -161,7 +216,10 @@ def get_checksum(self, file_path: str) -> str:
 class CSVValidator(DataValidator):
     """Validator for CSV benchmark data files"""
     
-    def __init__(self, expected_columns: Optional[List[str]] = None):
+    def __init__(self, expected_columns: Optional[List[str]] = None,
+                 hash_cache: Optional[HashCache] = None,
+                 algorithm: str = DEFAULT_ALGORITHM):
+        super().__init__(hash_cache, algorithm)
         self.expected_columns = expected_columns or [
             'algorithm',
             'operation',
@@ -170,24 +228,37 @@ def __init__(self, expected_columns: Optional[List[str]] = None):
             'median'
         ]
     
+    # Columns that must not be blank / must hold non-negative numbers
+    NON_EMPTY_COLUMNS = ['algorithm', 'operation']
+    NUMERIC_COLUMNS = ['iterations', 'mean', 'median', 'min', 'max', 'stddev']
+    
+    # Files at least this large are checked column-wise with pandas (if installed)
+    VECTORIZED_MIN_SIZE = 1 << 20
+    
     def validate(self, file_path: str) -> ValidationResult:
         """Validate CSV file structure and content"""
         errors = []
         warnings = []
         
-        # Check file exists
-        if not Path(file_path).exists():
+        # Check file exists (this one stat also serves the size and cache checks)
+        try:
+            stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             errors.append(f"File not found: {file_path}")
             return ValidationResult(False, errors, warnings, file_path)
         
         # Check file is not empty
-        if Path(file_path).stat().st_size == 0:
+        if stat.st_size == 0:
             errors.append(f"File is empty: {file_path}")
             return ValidationResult(False, errors, warnings, file_path)
         
+        # Read once: the same bytes are parsed and hashed
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        
         # Try to parse CSV
         try:
-            with open(file_path, 'r') as f:
+            with io.TextIOWrapper(io.BytesIO(content)) as f:
                 reader = csv.DictReader(f)
                 headers = reader.fieldnames
                 
@@ -202,25 +273,15 @@ def validate(self, file_path: str) -> ValidationResult:
                     warnings.append(f"Missing expected columns: {missing_cols}")
                 
                 # Validate rows
-                row_count = 0
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is 1)
-                    row_count += 1
-                    
-                    # Check for empty values in critical columns
-                    for col in ['algorithm', 'operation']:
-                        if col in row and not row[col].strip():
-                            errors.append(f"Row {row_num}: Empty value in column '{col}'")
-                    
-                    # Validate numeric columns
-                    numeric_cols = ['iterations', 'mean', 'median', 'min', 'max', 'stddev']
-                    for col in numeric_cols:
-                        if col in row and row[col].strip():
-                            try:
-                                value = float(row[col])
-                                if value < 0:
-                                    errors.append(f"Row {row_num}: Negative value in '{col}': {value}")
-                            except ValueError:
-                                errors.append(f"Row {row_num}: Invalid numeric value in '{col}': {row[col]}")
+                if _HAS_PANDAS and stat.st_size >= self.VECTORIZED_MIN_SIZE:
+                    try:
+                        row_errors, row_count = self._check_rows_vectorized(content, headers)
+                    except Exception:
+                        # pandas rejected the layout (e.g. ragged rows); use the row loop
+                        row_errors, row_count = self._check_rows(reader.reader, headers)
+                else:
+                    row_errors, row_count = self._check_rows(reader.reader, headers)
+                errors.extend(map(format_message, row_errors))
                 
                 if row_count == 0:
                     warnings.append("CSV file has no data rows")
@@ -230,18 +291,115 @@ def validate(self, file_path: str) -> ValidationResult:
             return ValidationResult(False, errors, warnings, file_path)
         
         # Calculate checksum
-        checksum = self.get_checksum(file_path)
+        checksum = self.get_checksum(file_path, content, stat)
         
         is_valid = len(errors) == 0
         return ValidationResult(is_valid, errors, warnings, file_path, checksum)
     
-    def get_checksum(self, file_path: str) -> str:
-        """Calculate SHA256 checksum of file"""
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+    def _check_rows(self, rows: Iterator[List[str]],
+                    headers: List[str]) -> Tuple[List[Message], int]:
+        """Check data rows one at a time; returns (errors, row_count)"""
+        # Resolve column positions once instead of building a dict per row
+        # (last occurrence wins for duplicate headers, as with csv.DictReader)
+        index = {col: i for i, col in enumerate(headers)}
+        non_empty = [(col, index[col]) for col in self.NON_EMPTY_COLUMNS if col in index]
+        numeric = [(col, index[col]) for col in self.NUMERIC_COLUMNS if col in index]
+        
+        errors = []
+        row_count = 0
+        row_num = 1  # header is row 1
+        for row in rows:
+            if not row:
+                continue  # blank lines are not data rows
+            row_count += 1
+            row_num += 1
+            
+            # Check for empty values in critical columns
+            for col, i in non_empty:
+                if not row[i].strip():
+                    errors.append((ROW_EMPTY_VALUE, (row_num, col)))
+            
+            # Validate numeric columns
+            for col, i in numeric:
+                cell = row[i]
+                if cell.strip():
+                    try:
+                        value = float(cell)
+                        if value < 0:
+                            errors.append((ROW_NEGATIVE_VALUE, (row_num, col, value)))
+                    except ValueError:
+                        errors.append((ROW_INVALID_NUMBER, (row_num, col, cell)))
+        
+        return errors, row_count
+    
+    def _check_rows_vectorized(self, content: bytes,
+                               headers: List[str]) -> Tuple[List[Message], int]:
+        """Same checks as _check_rows, evaluated per column with pandas
+        
+        Raises ValueError on any layout the two paths could read differently
+        (duplicate headers, quoted fields, lines whose field count differs
+        from the header's: pandas pads short rows with '' and may shift long
+        ones); the caller then falls back to _check_rows.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        if len(set(headers)) != len(headers):
+            raise ValueError("duplicate column names")
+        if b'"' in content:
+            raise ValueError("quoted fields")
+        
+        # Field count of every non-blank line: commas and non-newline bytes
+        # per line, counted in one pass over the raw bytes
+        data = np.frombuffer(content, dtype=np.uint8)
+        newline = data == ord('\n')
+        line_of = np.cumsum(newline) - newline
+        commas = np.bincount(line_of, weights=data == ord(','))
+        text = np.bincount(line_of, weights=~(newline | (data == ord('\r'))))
+        if ((text > 0) & (commas != len(headers) - 1)).any():
+            raise ValueError("row with a different number of fields than the header")
+        
+        checked = [col for col in headers
+                   if col in self.NON_EMPTY_COLUMNS or col in self.NUMERIC_COLUMNS]
+        # Keep values as raw strings so messages match the row-by-row path
+        df = pd.read_csv(io.BytesIO(content), usecols=checked or headers[:1],
+                         dtype=str, keep_default_na=False)
+        
+        # (row index, column order, error) so errors come out in row order
+        flagged = []
+        
+        for order, col in enumerate(self.NON_EMPTY_COLUMNS):
+            if col not in df.columns:
+                continue
+            empty = (df[col].str.strip() == '').to_numpy()
+            for idx in empty.nonzero()[0]:
+                flagged.append((idx, order, (ROW_EMPTY_VALUE, (idx + 2, col))))
+        
+        for order, col in enumerate(self.NUMERIC_COLUMNS, start=len(self.NON_EMPTY_COLUMNS)):
+            if col not in df.columns:
+                continue
+            raw = df[col]
+            stripped = raw.str.strip()
+            present = stripped != ''
+            values = pd.to_numeric(stripped.where(present), errors='coerce').astype(float)
+            for idx in (values < 0).to_numpy().nonzero()[0]:
+                # Re-parse flagged cells with float() so the value prints exactly as before
+                flagged.append((idx, order,
+                                (ROW_NEGATIVE_VALUE, (idx + 2, col, float(raw.iat[idx])))))
+            # Cells to_numeric could not parse are decided by float(), as in
+            # the row-by-row path (it also accepts e.g. 'nan', 'inf', '1_000')
+            for idx in (present & values.isna()).to_numpy().nonzero()[0]:
+                cell = raw.iat[idx]
+                try:
+                    value = float(cell)
+                except ValueError:
+                    flagged.append((idx, order, (ROW_INVALID_NUMBER, (idx + 2, col, cell))))
+                    continue
+                if value < 0:
+                    flagged.append((idx, order, (ROW_NEGATIVE_VALUE, (idx + 2, col, value))))
+        
+        flagged.sort(key=lambda item: (item[0], item[1]))
+        return [error for _, _, error in flagged], len(df)
 
 
 # ============================================================================
@@ -252,14 +410,16 @@ class ValidatorFactory:
     """Factory to create appropriate validator based on file type"""
     
     @staticmethod
-    def create_validator(file_path: str) -> Optional[DataValidator]:
+    def create_validator(file_path: str,
+                         hash_cache: Optional[HashCache] = None,
+                         algorithm: str = DEFAULT_ALGORITHM) -> Optional[DataValidator]:
         """Create validator based on file extension"""
         extension = Path(file_path).suffix.lower()
         
         if extension == '.json':
-            return JSONValidator()
+            return JSONValidator(hash_cache=hash_cache, algorithm=algorithm)
         elif extension == '.csv':
-            return CSVValidator()
+            return CSVValidator(hash_cache=hash_cache, algorithm=algorithm)
         else:
             return None
 
@@ -268,81 +428,128 @@ def create_validator(file_path: str) -> Optional[DataValidator]:
 # Batch Validation
 # ============================================================================
 
-def validate_directory(directory: str, recursive: bool = True) -> List[ValidationResult]:
-    """Validate all data files in a directory"""
+def parse_since(value: str) -> float:
+    """Resolve a --since argument (reference file or ISO timestamp) to a POSIX timestamp"""
+    if os.path.exists(value):
+        return os.stat(value).st_mtime
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"not an existing file or ISO timestamp: {value}") from None
+
+
+def load_last_validated(directory: Path) -> Optional[float]:
+    """Start time of the last fully valid run over ``directory``, if recorded"""
+    try:
+        with open(LAST_VALIDATED_FILE) as f:
+            runs = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return runs.get(str(directory.resolve())) if isinstance(runs, dict) else None
+
+
+def record_last_validated(directory: Path, started: float):
+    """Record ``started`` as the last fully valid run over ``directory``"""
+    try:
+        with open(LAST_VALIDATED_FILE) as f:
+            runs = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        runs = {}
+    if not isinstance(runs, dict):
+        runs = {}
+    runs[str(directory.resolve())] = started
+    with open(LAST_VALIDATED_FILE, 'w') as f:
+        json.dump(runs, f, indent=2)
+
+
+def validate_directory(directory: str, recursive: bool = True,
+                       hash_cache: Optional[HashCache] = None,
+                       algorithm: str = DEFAULT_ALGORITHM,
+                       since: Optional[float] = None) -> Tuple[List[ValidationResult], List[str]]:
+    """Validate all data files in a directory
+    
+    Files last modified before ``since`` (POSIX timestamp) are skipped.
+    Returns the results and the paths of the skipped files.
+    """
     results = []
     dir_path = Path(directory)
     
     if not dir_path.exists():
         print(f"Error: Directory not found: {directory}", file=sys.stderr)
-        return results
+        return results, []
     
-    # Find all JSON and CSV files
-    patterns = ['*.json', '*.csv']
+    # Find all JSON and CSV files in a single directory walk
     files = []
-    
-    for pattern in patterns:
-        if recursive:
-            files.extend(dir_path.rglob(pattern))
-        else:
-            files.extend(dir_path.glob(pattern))
-    
-    # Validate each file
-    for file_path in sorted(files):
-        validator = ValidatorFactory.create_validator(str(file_path))
-        if validator:
-            result = validator.validate(str(file_path))
-            results.append(result)
-    
-    return results
+    skipped = []
+    for path, stat in iter_files(dir_path, ('.json', '.csv'), recursive=recursive):
+        if since is not None and stat.st_mtime < since:
+            skipped.append(path)
+            continue
+        files.append(path)
+    
+    # Validate files concurrently: reading, hashing and JSON parsing release the GIL
+    def validate_one(file_path: str) -> Optional[ValidationResult]:
+        validator = ValidatorFactory.create_validator(file_path, hash_cache, algorithm)
+        return validator.validate(file_path) if validator else None
+    
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(validate_one, sorted(files)):
+            if result is not None:
+                results.append(result)
+    
+    return results, skipped
 
 
-def print_validation_summary(results: List[ValidationResult]) -> bool:
+def print_validation_summary(results: List[ValidationResult], skipped: int = 0) -> bool:
     """Print validation summary and return overall status"""
-    total = len(results)
-    valid = sum(1 for r in results if r.valid)
-    invalid = total - valid
-    
-    print(f"\n{'='*70}")
-    print(f"Validation Summary")
-    print(f"{'='*70}")
-    print(f"Total files validated: {total}")
-    print(f"Valid: {valid}")
-    print(f"Invalid: {invalid}")
-    print(f"{'='*70}\n")
-    
-    # Print details for invalid files
-    if invalid > 0:
-        print("Invalid Files:")
-        print("-" * 70)
-        for result in results:
-            if not result.valid:
-                print(f"\nERROR: {result.file_path}")
-                for error in result.errors:
-                    print(f"   ERROR: {error}")
-                for warning in result.warnings:
-                    print(f"   WARNING: {warning}")
-        print()
-    
-    # Print warnings for valid files
-    valid_with_warnings = [r for r in results if r.valid and r.warnings]
-    if valid_with_warnings:
-        print("Valid Files with Warnings:")
-        print("-" * 70)
-        for result in valid_with_warnings:
-            print(f"\n⚠️  {result.file_path}")
-            for warning in result.warnings:
-                print(f"   WARNING: {warning}")
-        print()
-    
-    # Print checksums if requested
-    print("Checksums:")
-    print("-" * 70)
+    # Build all three sections in one pass over the results
+    invalid_lines = []
+    warning_lines = []
+    checksum_lines = []
     for result in results:
+        if not result.valid:
+            invalid_lines.append(f"\nERROR: {result.file_path}")
+            invalid_lines.extend(f"   ERROR: {error}" for error in result.errors)
+            invalid_lines.extend(f"   WARNING: {warning}" for warning in result.warnings)
+        elif result.warnings:
+            warning_lines.append(f"\n⚠️  {result.file_path}")
+            warning_lines.extend(f"   WARNING: {warning}" for warning in result.warnings)
+        
         status = "VALID" if result.valid else "INVALID"
         checksum = result.checksum or "N/A"
-        print(f"{status} {Path(result.file_path).name}: {checksum[:16]}...")
-    print()
+        checksum_lines.append(
+            f"{status} {os.path.basename(result.file_path)}: {checksum[:16]}...")
+    
+    total = len(results)
+    invalid = sum(1 for r in results if not r.valid)
+    valid = total - invalid
+    
+    lines = [
+        f"\n{'='*70}",
+        "Validation Summary",
+        f"{'='*70}",
+        f"Total files validated: {total}",
+        f"Valid: {valid}",
+        f"Invalid: {invalid}",
+    ]
+    if skipped:
+        lines.append(f"Skipped {skipped} unchanged")
+    lines.append(f"{'='*70}\n")
+    
+    # Details for invalid files
+    if invalid_lines:
+        lines += ["Invalid Files:", "-" * 70] + invalid_lines + [""]
+    
+    # Warnings for valid files
+    if warning_lines:
+        lines += ["Valid Files with Warnings:", "-" * 70] + warning_lines + [""]
+    
+    # Checksums
+    lines += ["Checksums:", "-" * 70] + checksum_lines + [""]
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return invalid == 0
 
@@ -386,24 +593,69 @@ def main():
         help='Generate checksum file for validated data'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-hash files instead of reusing the shared hash cache'
+    )
+    
+    parser.add_argument(
+        '--algorithm',
+        choices=SUPPORTED_ALGORITHMS,
+        default=DEFAULT_ALGORITHM,
+        help='Checksum algorithm; blake3 is faster but needs the blake3 package (default: sha256)'
+    )
+    
+    parser.add_argument(
+        '-s', '--since',
+        type=parse_since,
+        metavar='FILE_OR_TIMESTAMP',
+        help='Only validate files modified at or after this ISO timestamp or '
+             'reference file\'s mtime (default: validate every file)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only validate files modified since the last fully valid run over the '
+             'same directory (files copied with preserved mtimes are not revalidated)'
+    )
+    
     args = parser.parse_args()
     
+    # Recorded before any file is read, so files modified during this run are revalidated next time
+    run_started = datetime.now().timestamp()
+    
     # Validate path
     path = Path(args.path)
     
+    since = args.since
+    if since is None and args.incremental and path.is_dir():
+        since = load_last_validated(path)
+    
+    try:
+        get_hasher(args.algorithm)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    hash_cache = None if args.no_cache else HashCache()
+    
     if path.is_file():
         # Validate single file
-        validator = ValidatorFactory.create_validator(str(path))
+        validator = ValidatorFactory.create_validator(str(path), hash_cache, args.algorithm)
         if validator is None:
             print(f"Error: Unsupported file type: {path.suffix}", file=sys.stderr)
             return 1
         
         result = validator.validate(str(path))
         results = [result]
+        skipped = []
     
     elif path.is_dir():
         # Validate directory
-        results = validate_directory(str(path), args.recursive)
+        results, skipped = validate_directory(str(path), args.recursive, hash_cache,
+                                              args.algorithm, since)
     
     else:
         print(f"Error: Path not found: {path}", file=sys.stderr)
@@ -426,19 +678,35 @@ def main():
                     print(f"    - {warning}")
     
     # Print summary
-    all_valid = print_validation_summary(results)
-    
-    # Generate checksums file if requested
-    if args.checksums and results:
+    all_valid = print_validation_summary(results, len(skipped))
+    
+    # Remember this run for --incremental (explicit --since runs may be partial)
+    if all_valid and path.is_dir() and args.since is None:
+        record_last_validated(path, run_started)
+    
+    # Generate checksums file if requested, always over the full file set:
+    # files skipped as unchanged are hashed (or served from the cache) too
+    if args.checksums and (results or skipped):
+        checksums = {result.file_path: result.checksum for result in results if result.checksum}
+        for file_path in skipped:
+            checksums[file_path] = (hash_cache.get_digest(file_path, algorithm=args.algorithm)
+                                    if hash_cache is not None
+                                    else calculate_digest(file_path, args.algorithm))
         checksums_file = Path(args.path).parent / "checksums.txt"
+        lines = [
+            f"# Checksums generated on {datetime.now().isoformat()}",
+            f"# Algorithm: {args.algorithm}",
+            f"# Total files: {len(checksums)}",
+            "",
+        ]
+        lines.extend(f"{checksum}  {file_path}" for file_path, checksum in sorted(checksums.items()))
         with open(checksums_file, 'w') as f:
-            f.write(f"# Checksums generated on {datetime.now().isoformat()}\n")
-            f.write(f"# Total files: {len(results)}\n\n")
-            for result in results:
-                if result.checksum:
-                    f.write(f"{result.checksum}  {result.file_path}\n")
+            f.write("\n".join(lines) + "\n")
         print(f"Checksums written to: {checksums_file}")
     
+    if hash_cache is not None:
+        hash_cache.save()
+    
     return 0 if all_valid else 1
 
 
@@ -12,11 +12,28 @@
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Headless backend: files only, no GUI init (also in worker processes)
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.ticker import FixedLocator, FuncFormatter, MultipleLocator, NullFormatter
+import io
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache, partial
 from pathlib import Path
 from datetime import datetime
 
+# Errors that make the Parquet sidecar unreadable or unwritable; it is only a
+# cache, so the CSV is used instead
+try:
+    from pyarrow import ArrowException
+    PARQUET_ERRORS = (ImportError, OSError, ValueError, ArrowException)
+except ImportError:
+    PARQUET_ERRORS = (ImportError, OSError, ValueError)
+
 # Path configuration (relative to project root)
 BASE_DIR = Path(__file__).parent.parent.parent  # Benchmarks-PQC/
 DATA_DIR = BASE_DIR / "data" / "processed"
@@ -34,7 +51,14 @@
 plt.rcParams['axes.titlesize'] = 14
 plt.rcParams['axes.labelsize'] = 12
 plt.rcParams['legend.fontsize'] = 10
-plt.rcParams['figure.dpi'] = 150
+plt.rcParams['figure.dpi'] = 100  # Canvas only; savefig dpi (FORMAT_DPI) sets output resolution
+# Every figure uses constrained layout (solved during draw; no tight_layout pass)
+plt.rcParams['figure.constrained_layout.use'] = True
+# Merge nearly collinear path segments (fewer PDF path nodes)
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+# Embed fonts as TrueType (Type 42) subsets rather than Type 3 glyph procedures
+plt.rcParams['pdf.fonttype'] = 42
 
 # Colors for architectures
 COLORS = {
@@ -43,459 +67,505 @@
     'RISC-V64': '#e74c3c'    # Rojo
 }
 
+# Output formats; set PQC_FIG_FORMATS=png to skip PDF encoding while iterating
+FORMATS = tuple(fmt.strip() for fmt in os.environ.get('PQC_FIG_FORMATS', 'png,pdf').split(','))
+
+# savefig dpi per format: PNGs at 150 (still above screen density). PDFs are
+# vector; their dpi only sets the colorbar gradient's raster, so 150 there too
+FORMAT_DPI = {'png': 150, 'pdf': 150}
+DEFAULT_DPI = 300
+
+# Architectures in plotting order (axis 0 of the mean_us tensor)
+ARCHITECTURES = ['x86_64', 'ARM64', 'RISC-V64']
+
+# Algorithm families: one figure each in plot_family_comparison, one panel each elsewhere
+FAMILIES = {
+    'mlkem': {
+        'name': 'mlkem_comparison',
+        'title': 'ML-KEM',
+        'algorithms': ['ML-KEM-512', 'ML-KEM-768', 'ML-KEM-1024'],
+        'levels': ['512', '768', '1024'],
+        'operations': ['keygen', 'encaps', 'decaps'],
+        'op_titles': ['KeyGen', 'Encaps', 'Decaps'],
+        'value_fmt': '{:.1f}',
+    },
+    'mldsa': {
+        'name': 'mldsa_comparison',
+        'title': 'ML-DSA',
+        'algorithms': ['ML-DSA-44', 'ML-DSA-65', 'ML-DSA-87'],
+        'levels': ['44', '65', '87'],
+        'operations': ['keygen', 'sign', 'verify'],
+        'op_titles': ['KeyGen', 'Sign', 'Verify'],
+        'value_fmt': '{:.0f}',
+    },
+}
+
+# Every algorithm charted, in tensor order
+ALL_ALGORITHMS = [algo for family in FAMILIES.values() for algo in family['algorithms']]
+
+# Label columns loaded as categoricals (cheap equality masks and groupbys)
+CATEGORICAL_COLUMNS = ['architecture', 'algorithm', 'operation']
+
+# Category order of the label columns: the order the figures plot them in
+PLOT_ORDER = {'architecture': ARCHITECTURES, 'algorithm': ALL_ALGORITHMS}
+
+# The only columns the figures read; the other statistics are never loaded
+LOAD_COLUMNS = CATEGORICAL_COLUMNS + ['mean_us']
+
+
+def family_rows(family):
+    """Slice selecting a family's algorithms along the tensor's algorithm axis.
+    
+    Each family is a contiguous block of ALL_ALGORITHMS, so indexing with
+    the slice returns a view instead of gathering into a new array.
+    """
+    start = ALL_ALGORITHMS.index(family['algorithms'][0])
+    return slice(start, start + len(family['algorithms']))
+
 
 def load_data():
-    """Load processed data."""
+    """Load processed data.
+    
+    Only LOAD_COLUMNS are read. The CSV is parsed once and cached as a
+    Parquet sidecar, with the label columns stored as categoricals; the
+    cache is rebuilt whenever the CSV is newer or cannot be read. Without a
+    Parquet engine (pyarrow) the CSV is read every time.
+    """
     csv_path = DATA_DIR / "processed_data.csv"
-    df = pd.read_csv(csv_path)
+    parquet_path = DATA_DIR / "processed_data.parquet"
+    
+    df = None
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        try:
+            df = pd.read_parquet(parquet_path, columns=LOAD_COLUMNS)
+        except PARQUET_ERRORS:
+            # No Parquet engine, or a truncated/corrupt cache: rebuild from the CSV
+            df = None
+    
+    if df is None:
+        df = pd.read_csv(csv_path, usecols=LOAD_COLUMNS,
+                         dtype={col: 'category' for col in CATEGORICAL_COLUMNS})
+        # Order categories as plotted (unknown labels kept, after the known ones)
+        for col, order in PLOT_ORDER.items():
+            extra = [label for label in df[col].cat.categories if label not in order]
+            df[col] = df[col].cat.set_categories(order + extra, ordered=True)
+        try:
+            df.to_parquet(parquet_path, compression='zstd')
+        except ImportError:
+            pass
+        except PARQUET_ERRORS as e:
+            # Read-only or full data directory: carry on with the CSV-loaded frame
+            print(f" Warning: Parquet cache not written ({type(e).__name__}: {e})")
+    
     print(f" Data loaded: {len(df)} records")
     return df
 
 
-def plot_mlkem_comparison(df):
-    """Generate comparative chart de ML-KEM por arquitectura."""
-    print("\n Generating chart ML-KEM...")
-    
-    fig, axes = plt.subplots(1, 3, figsize=(14, 5))
-    
-    operations = ['keygen', 'encaps', 'decaps']
-    op_titles = ['KeyGen', 'Encaps', 'Decaps']
-    algorithms = ['ML-KEM-512', 'ML-KEM-768', 'ML-KEM-1024']
-    architectures = ['x86_64', 'ARM64', 'RISC-V64']
-    
-    x = np.arange(len(algorithms))
-    width = 0.25
-    
-    for ax_idx, (op, title) in enumerate(zip(operations, op_titles)):
-        ax = axes[ax_idx]
-        
-        for i, arch in enumerate(architectures):
-            values = []
-            for algo in algorithms:
-                val = df[(df['architecture'] == arch) & 
-                        (df['algorithm'] == algo) & 
-                        (df['operation'] == op)]['mean_us'].values
-                values.append(val[0] if len(val) > 0 else 0)
-            
-            bars = ax.bar(x + i*width, values, width, label=arch, color=COLORS[arch])
-            
-            # Add values sobre las barras
-            for bar, val in zip(bars, values):
-                if val > 0:
-                    ax.annotate(f'{val:.1f}',
-                               xy=(bar.get_x() + bar.get_width()/2, bar.get_height()),
-                               xytext=(0, 3), textcoords="offset points",
-                               ha='center', va='bottom', fontsize=8, rotation=45)
-        
-        ax.set_xlabel('Algorithm')
-        ax.set_ylabel('Time (µs)')
-        ax.set_title(f'ML-KEM {title}')
-        ax.set_xticks(x + width)
-        ax.set_xticklabels(['512', '768', '1024'])
-        ax.legend()
-        ax.set_yscale('log')
-    
-    plt.suptitle('Performance Comparison ML-KEM by Architecture', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    
-    # Guardar
-    for fmt in ['png', 'pdf']:
-        fig.savefig(OUTPUT_DIR / f'mlkem_comparison.{fmt}', dpi=300, bbox_inches='tight')
-        fig.savefig(THESIS_DIR / f'mlkem_comparison.{fmt}', dpi=300, bbox_inches='tight')
-    
-    plt.close()
-    print(f"   Saved: mlkem_comparison.png/pdf")
+def preprocess(df):
+    """Aggregate the data once for all plot functions.
+    
+    Returns a dict with:
+    - 'mean_us': ndarray of mean_us[architecture, algorithm, operation], with
+      axes ordered as ARCHITECTURES, the FAMILIES algorithms and each family's
+      operations (NaN where there is no data)
+    - 'algo_mean_us': mean_us per [architecture, algorithm] as a dense ndarray
+      (NaN where there is no data)
+    - 'overhead': algorithm x architecture table of mean_us relative to x86_64,
+      rows ordered as ALL_ALGORITHMS and columns as ARCHITECTURES
+    - 'arm_advantage': ARM64 advantage over RISC-V64 in %, as an
+      [algorithm, operation] ndarray (positive = ARM64 faster)
+    """
+    # Unsorted groupbys: every consumer looks groups up by key or reindexes them
+    keys = ['architecture', 'algorithm', 'operation']
+    mean_by_arch_algo_op = df.groupby(keys, sort=False, observed=True)['mean_us'].mean()
+    mean_by_arch_algo = df.groupby(keys[:2], sort=False, observed=True)['mean_us'].mean()
+    
+    # Lay the per-operation means out as a dense (arch, algorithm, operation) tensor
+    algo_ops = [(algo, op) for family in FAMILIES.values()
+                for algo in family['algorithms'] for op in family['operations']]
+    cells = [(arch, algo, op) for arch in ARCHITECTURES for algo, op in algo_ops]
+    mean_us = (mean_by_arch_algo_op.reindex(pd.MultiIndex.from_tuples(cells))
+               .to_numpy(dtype=float)
+               .reshape(len(ARCHITECTURES), len(ALL_ALGORITHMS), -1))
+    
+    means = (mean_by_arch_algo.unstack('architecture')
+             .reindex(index=ALL_ALGORITHMS, columns=ARCHITECTURES))
+    overhead = means.div(means['x86_64'], axis=0)
+    algo_mean_us = means.to_numpy(dtype=float).T
+    
+    arm_means = mean_us[ARCHITECTURES.index('ARM64')]
+    riscv_means = mean_us[ARCHITECTURES.index('RISC-V64')]
+    arm_advantage = (riscv_means - arm_means) / riscv_means * 100
+    
+    return {
+        'mean_us': mean_us,
+        'algo_mean_us': algo_mean_us,
+        'overhead': overhead,
+        'arm_advantage': arm_advantage,
+    }
+
+
+def has_data(aggregates, algorithms):
+    """Check there is any data for the algorithms, printing a note on the gaps.
+    
+    Missing architecture/algorithm pairs only get the note: the plots still
+    draw the data there is, leaving those bars and points out.
+    """
+    # One vectorized NaN test over the [architecture, algorithm] means
+    columns = [ALL_ALGORITHMS.index(algo) for algo in algorithms]
+    absent = np.isnan(aggregates['algo_mean_us'][:, columns])
+    if absent.all():
+        print(f"   Skipped: no data for {', '.join(algorithms)}")
+        return False
+    if absent.any():
+        missing = [f'{ARCHITECTURES[i]}/{algorithms[j]}' for i, j in zip(*np.nonzero(absent))]
+        print(f"   No data for {', '.join(missing)}")
+    return True
+
+
+def publish_file(src, dst):
+    """Make dst a hard link to src, so the file is written to disk only once.
+    
+    Falls back to a byte copy where links are not possible (e.g. THESIS_DIR
+    on another filesystem).
+    """
+    if dst.exists() and dst.samefile(src):
+        # Already linked by a previous run (savefig rewrote the shared inode)
+        return
+    try:
+        dst.unlink(missing_ok=True)
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def save_figure(fig, name):
+    """Save a figure in each of FORMATS (PNG and PDF by default), rendering each once.
+    
+    Files are written to OUTPUT_DIR and published to THESIS_DIR with
+    publish_file().
+    """
+    # Lay out and measure the tight bounding box once, shared by every format
+    fig.draw_without_rendering()
+    bbox = fig.get_tightbbox().padded(plt.rcParams['savefig.pad_inches'])
+    for fmt in FORMATS:
+        out = OUTPUT_DIR / f'{name}.{fmt}'
+        fig.savefig(out, dpi=FORMAT_DPI.get(fmt, DEFAULT_DPI), bbox_inches=bbox)
+        publish_file(out, THESIS_DIR / out.name)
+
+
+@lru_cache(maxsize=None)
+def _figure_template(nrows, ncols, figsize):
+    """Create a (fig, axes) layout once per process."""
+    return plt.subplots(nrows, ncols, figsize=figsize)
+
+
+def get_figure(nrows, ncols, figsize):
+    """Return the cached (fig, axes) for a layout, with every axes cleared.
+    
+    Figures sharing a layout reuse one Figure instead of rebuilding axes,
+    ticks and style lookups; callers must not close the returned figure.
+    """
+    fig, axes = _figure_template(nrows, ncols, figsize)
+    layout_axes = list(np.atleast_1d(axes).flat)
+    # Drop axes added by the previous plot (e.g. a colorbar) before clearing
+    for ax in fig.axes:
+        if ax not in layout_axes:
+            ax.remove()
+    for ax in layout_axes:
+        ax.cla()
+    return fig, axes
+
+
+def log10_values(values):
+    """log10 of positive values; missing (<= 0) values become NaN and are not drawn."""
+    values = np.asarray(values, dtype=float)
+    return np.log10(np.where(values > 0, values, np.nan))
+
+
+def _format_minor_log10_tick(y, _):
+    """Label 2, 3, 4 and 6 × 10^n (the subset matplotlib's log scale labels)."""
+    mantissa = round(10 ** (y % 1))
+    if mantissa not in (2, 3, 4, 6):
+        return ''
+    return f'${mantissa} \\times 10^{{{y // 1:.0f}}}$'
+
 
+def log10_bar_bottom(heights):
+    """Decade below the shortest of the (log10) bar ``heights``, 0 if none is finite.
+    
+    Bars rise from there, as on a log scale, instead of from 10^0 = 1 µs
+    (which would hang bars for sub-µs means downward).
+    """
+    heights = np.asarray(heights, dtype=float)
+    heights = heights[np.isfinite(heights)]
+    return np.floor(heights.min()) if heights.size else 0.0
 
-def plot_mldsa_comparison(df):
-    """Generate comparative chart de ML-DSA por arquitectura."""
-    print("\n Generating chart ML-DSA...")
+
+def set_log10_yaxis(ax, bar_heights=None):
+    """Label a y axis that holds log10 data like a log scale.
+    
+    Bar charts pass their (log10) ``bar_heights`` so the axis starts at the
+    decade below the shortest bar, where log10_bar_bottom() starts the bars,
+    instead of at 10^0, with a tenth of the bar span above the tallest bar
+    for value labels (all-NaN heights leave the limits alone). There is a
+    labeled tick per decade and minor ticks at 2-9 × 10^n; the minor ticks
+    are labeled too (2, 3, 4, 6 × 10^n) when the data spans less than one
+    whole decade between decade ticks, the rule matplotlib's log formatter
+    applies (measured from the shortest bar, not from the floored lower
+    limit).
+    """
+    low, high = ax.get_ylim()
+    data_low = low
+    if bar_heights is not None:
+        heights = np.asarray(bar_heights, dtype=float)
+        heights = heights[np.isfinite(heights)]
+        if heights.size:
+            data_low = heights.min()
+            low = np.floor(data_low)
+            # Headroom above the tallest bar for the rotated value labels
+            high = max(high, heights.max() + 0.1 * (heights.max() - low))
+            ax.set_ylim(low, high)
+    
+    decades = np.arange(np.floor(low), np.ceil(high))
+    minor = (decades[:, None] + np.log10(np.arange(2, 10))).ravel()
+    
+    ax.yaxis.set_major_locator(MultipleLocator(1))
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda y, _: f'$10^{{{y:.0f}}}$'))
+    ax.yaxis.set_minor_locator(FixedLocator(minor[(minor >= low) & (minor <= high)]))
+    if np.floor(high) - np.ceil(data_low) < 1:
+        ax.yaxis.set_minor_formatter(FuncFormatter(_format_minor_log10_tick))
+    else:
+        ax.yaxis.set_minor_formatter(NullFormatter())
+
+
+def plot_family_comparison(aggregates, family):
+    """Generate comparative chart de una familia (see FAMILIES) por arquitectura."""
+    print(f"\n Generating chart {family['title']}...")
+    if not has_data(aggregates, family['algorithms']):
+        return
     
-    fig, axes = plt.subplots(1, 3, figsize=(14, 5))
+    fig, axes = get_figure(1, 3, (14, 5))
     
-    operations = ['keygen', 'sign', 'verify']
-    op_titles = ['KeyGen', 'Sign', 'Verify']
-    algorithms = ['ML-DSA-44', 'ML-DSA-65', 'ML-DSA-87']
-    architectures = ['x86_64', 'ARM64', 'RISC-V64']
+    algorithms = family['algorithms']
     
     x = np.arange(len(algorithms))
     width = 0.25
     
-    for ax_idx, (op, title) in enumerate(zip(operations, op_titles)):
+    # mean_us[arch, algorithm, operation] for this family's algorithms
+    mean_us = aggregates['mean_us'][:, family_rows(family), :]
+    
+    # All bars of a subplot are drawn by one ax.bar call, grouped by architecture
+    xs = (x[None, :] + (np.arange(len(ARCHITECTURES)) * width)[:, None]).ravel()
+    colors = np.repeat([COLORS[arch] for arch in ARCHITECTURES], len(algorithms))
+    
+    for ax_idx, title in enumerate(family['op_titles']):
         ax = axes[ax_idx]
         
-        for i, arch in enumerate(architectures):
-            values = []
-            for algo in algorithms:
-                val = df[(df['architecture'] == arch) & 
-                        (df['algorithm'] == algo) & 
-                        (df['operation'] == op)]['mean_us'].values
-                values.append(val[0] if len(val) > 0 else 0)
-            
-            bars = ax.bar(x + i*width, values, width, label=arch, color=COLORS[arch])
-            
-            # Add values sobre las barras
-            for bar, val in zip(bars, values):
-                if val > 0:
-                    ax.annotate(f'{val:.0f}',
-                               xy=(bar.get_x() + bar.get_width()/2, bar.get_height()),
-                               xytext=(0, 3), textcoords="offset points",
-                               ha='center', va='bottom', fontsize=8, rotation=45)
+        # Heights are log10(µs), rising from the decade below the shortest bar;
+        # labels show the raw values
+        values = mean_us[:, :, ax_idx].ravel()
+        heights = log10_values(values)
+        bottom = log10_bar_bottom(heights)
+        bars = ax.bar(xs, heights - bottom, width, bottom=bottom, color=colors)
+        
+        # Add values sobre las barras (missing values stay unlabeled)
+        ax.bar_label(bars, labels=[family['value_fmt'].format(val) if val > 0 else ''
+                                   for val in values],
+                     padding=3, fontsize=8, rotation=45)
         
         ax.set_xlabel('Algorithm')
         ax.set_ylabel('Time (µs)')
-        ax.set_title(f'ML-DSA {title}')
+        ax.set_title(f"{family['title']} {title}")
         ax.set_xticks(x + width)
-        ax.set_xticklabels(['44', '65', '87'])
-        ax.legend()
-        ax.set_yscale('log')
+        ax.set_xticklabels(family['levels'])
+        # One legend entry per architecture, using its first bar as the handle
+        ax.legend(bars.patches[::len(algorithms)], ARCHITECTURES)
+        set_log10_yaxis(ax, heights)
     
-    plt.suptitle('Performance Comparison ML-DSA by Architecture', fontsize=14, fontweight='bold')
-    plt.tight_layout()
+    fig.suptitle(f"Performance Comparison {family['title']} by Architecture",
+                 fontsize=14, fontweight='bold')
     
     # Guardar
-    for fmt in ['png', 'pdf']:
-        fig.savefig(OUTPUT_DIR / f'mldsa_comparison.{fmt}', dpi=300, bbox_inches='tight')
-        fig.savefig(THESIS_DIR / f'mldsa_comparison.{fmt}', dpi=300, bbox_inches='tight')
+    save_figure(fig, family['name'])
     
-    plt.close()
-    print(f"   Saved: mldsa_comparison.png/pdf")
+    print(f"   Saved: {family['name']}.{'/'.join(FORMATS)}")
 
 
-def plot_architecture_overhead(df):
+def plot_architecture_overhead(aggregates):
     """Genera gráfica de overhead de emulación QEMU."""
     print("\n Generating chart de overhead QEMU...")
+    if not has_data(aggregates, ALL_ALGORITHMS):
+        return
     
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    overhead = aggregates['overhead']
+    emulated = ['ARM64', 'RISC-V64']
     
-    # ML-KEM
-    ax = axes[0]
-    algorithms = ['ML-KEM-512', 'ML-KEM-768', 'ML-KEM-1024']
-    x = np.arange(len(algorithms))
-    width = 0.35
+    fig, axes = get_figure(1, 2, (12, 5))
     
-    arm_overhead = []
-    riscv_overhead = []
+    width = 0.35
     
-    for algo in algorithms:
-        x86_mean = df[(df['architecture'] == 'x86_64') & (df['algorithm'] == algo)]['mean_us'].mean()
-        arm_mean = df[(df['architecture'] == 'ARM64') & (df['algorithm'] == algo)]['mean_us'].mean()
-        riscv_mean = df[(df['architecture'] == 'RISC-V64') & (df['algorithm'] == algo)]['mean_us'].mean()
+    for ax, family in zip(axes, FAMILIES.values()):
+        algorithms = family['algorithms']
+        x = np.arange(len(algorithms))
         
-        arm_overhead.append(arm_mean / x86_mean)
-        riscv_overhead.append(riscv_mean / x86_mean)
-    
-    bars1 = ax.bar(x - width/2, arm_overhead, width, label='ARM64', color=COLORS['ARM64'])
-    bars2 = ax.bar(x + width/2, riscv_overhead, width, label='RISC-V64', color=COLORS['RISC-V64'])
-    
-    ax.set_xlabel('Algorithm')
-    ax.set_ylabel('Overhead (× vs x86_64)')
-    ax.set_title('ML-KEM: QEMU Emulation Overhead')
-    ax.set_xticks(x)
-    ax.set_xticklabels(['512', '768', '1024'])
-    ax.legend()
-    ax.axhline(y=1, color='gray', linestyle='--', alpha=0.5)
-    
-    # Add values
-    for bar in bars1:
-        ax.annotate(f'{bar.get_height():.1f}×',
-                   xy=(bar.get_x() + bar.get_width()/2, bar.get_height()),
-                   xytext=(0, 3), textcoords="offset points",
-                   ha='center', va='bottom', fontsize=9)
-    for bar in bars2:
-        ax.annotate(f'{bar.get_height():.1f}×',
-                   xy=(bar.get_x() + bar.get_width()/2, bar.get_height()),
-                   xytext=(0, 3), textcoords="offset points",
-                   ha='center', va='bottom', fontsize=9)
-    
-    # ML-DSA
-    ax = axes[1]
-    algorithms = ['ML-DSA-44', 'ML-DSA-65', 'ML-DSA-87']
-    x = np.arange(len(algorithms))
-    
-    arm_overhead = []
-    riscv_overhead = []
-    
-    for algo in algorithms:
-        x86_mean = df[(df['architecture'] == 'x86_64') & (df['algorithm'] == algo)]['mean_us'].mean()
-        arm_mean = df[(df['architecture'] == 'ARM64') & (df['algorithm'] == algo)]['mean_us'].mean()
-        riscv_mean = df[(df['architecture'] == 'RISC-V64') & (df['algorithm'] == algo)]['mean_us'].mean()
+        # Both architectures' bars in one ax.bar call, grouped by architecture
+        values = overhead.loc[algorithms, emulated].to_numpy().T.ravel()
+        xs = np.concatenate([x - width/2, x + width/2])
+        colors = np.repeat([COLORS[arch] for arch in emulated], len(algorithms))
+        bars = ax.bar(xs, values, width, color=colors)
         
-        arm_overhead.append(arm_mean / x86_mean)
-        riscv_overhead.append(riscv_mean / x86_mean)
-    
-    bars1 = ax.bar(x - width/2, arm_overhead, width, label='ARM64', color=COLORS['ARM64'])
-    bars2 = ax.bar(x + width/2, riscv_overhead, width, label='RISC-V64', color=COLORS['RISC-V64'])
-    
-    ax.set_xlabel('Algorithm')
-    ax.set_ylabel('Overhead (× vs x86_64)')
-    ax.set_title('ML-DSA: QEMU Emulation Overhead')
-    ax.set_xticks(x)
-    ax.set_xticklabels(['44', '65', '87'])
-    ax.legend()
-    ax.axhline(y=1, color='gray', linestyle='--', alpha=0.5)
-    
-    # Add values
-    for bar in bars1:
-        ax.annotate(f'{bar.get_height():.1f}×',
-                   xy=(bar.get_x() + bar.get_width()/2, bar.get_height()),
-                   xytext=(0, 3), textcoords="offset points",
-                   ha='center', va='bottom', fontsize=9)
-    for bar in bars2:
-        ax.annotate(f'{bar.get_height():.1f}×',
-                   xy=(bar.get_x() + bar.get_width()/2, bar.get_height()),
-                   xytext=(0, 3), textcoords="offset points",
-                   ha='center', va='bottom', fontsize=9)
-    
-    plt.suptitle('QEMU Emulation Overhead vs Native x86_64', fontsize=14, fontweight='bold')
-    plt.tight_layout()
+        ax.set_xlabel('Algorithm')
+        ax.set_ylabel('Overhead (× vs x86_64)')
+        ax.set_title(f"{family['title']}: QEMU Emulation Overhead")
+        ax.set_xticks(x)
+        ax.set_xticklabels(family['levels'])
+        ax.legend(bars.patches[::len(algorithms)], emulated)
+        ax.axhline(y=1, color='gray', linestyle='--', alpha=0.5)
+        
+        # Add values (missing values stay unlabeled)
+        ax.bar_label(bars, labels=[f'{val:.1f}×' if val > 0 else '' for val in values],
+                     padding=3, fontsize=9)
+    
+    fig.suptitle('QEMU Emulation Overhead vs Native x86_64', fontsize=14, fontweight='bold')
     
     # Guardar
-    for fmt in ['png', 'pdf']:
-        fig.savefig(OUTPUT_DIR / f'qemu_overhead.{fmt}', dpi=300, bbox_inches='tight')
-        fig.savefig(THESIS_DIR / f'qemu_overhead.{fmt}', dpi=300, bbox_inches='tight')
+    save_figure(fig, 'qemu_overhead')
     
-    plt.close()
-    print(f"   Saved: qemu_overhead.png/pdf")
+    print(f"   Saved: qemu_overhead.{'/'.join(FORMATS)}")
 
 
-def plot_arm_vs_riscv(df):
+def plot_arm_vs_riscv(aggregates):
     """Genera gráfica de comparación ARM64 vs RISC-V64."""
     print("\n Generating chart ARM64 vs RISC-V64...")
+    if not has_data(aggregates, ALL_ALGORITHMS):
+        return
     
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    # ARM64 advantage (%) per [algorithm, operation]; positivo = ARM64 más rápido
+    advantage = aggregates['arm_advantage']
     
-    # ML-KEM
-    ax = axes[0]
-    algorithms = ['ML-KEM-512', 'ML-KEM-768', 'ML-KEM-1024']
-    operations = ['keygen', 'encaps', 'decaps']
+    fig, axes = get_figure(1, 2, (12, 5))
     
-    x = np.arange(len(algorithms))
     width = 0.25
     
-    for i, op in enumerate(operations):
-        advantages = []
-        for algo in algorithms:
-            arm_val = df[(df['architecture'] == 'ARM64') & 
-                        (df['algorithm'] == algo) & 
-                        (df['operation'] == op)]['mean_us'].values[0]
-            riscv_val = df[(df['architecture'] == 'RISC-V64') & 
-                          (df['algorithm'] == algo) & 
-                          (df['operation'] == op)]['mean_us'].values[0]
-            # Positivo = ARM64 más rápido
-            advantage = ((riscv_val - arm_val) / riscv_val) * 100
-            advantages.append(advantage)
+    for ax, family in zip(axes, FAMILIES.values()):
+        algorithms = family['algorithms']
+        x = np.arange(len(algorithms))
         
-        bars = ax.bar(x + i*width, advantages, width, label=op.capitalize())
-    
-    ax.set_xlabel('Algorithm')
-    ax.set_ylabel('ARM64 Advantage (%)')
-    ax.set_title('ML-KEM: ARM64 Advantage over RISC-V64')
-    ax.set_xticks(x + width)
-    ax.set_xticklabels(['512', '768', '1024'])
-    ax.legend()
-    ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
-    ax.set_ylim(-30, 30)
-    
-    # ML-DSA
-    ax = axes[1]
-    algorithms = ['ML-DSA-44', 'ML-DSA-65', 'ML-DSA-87']
-    operations = ['keygen', 'sign', 'verify']
-    
-    x = np.arange(len(algorithms))
-    
-    for i, op in enumerate(operations):
-        advantages = []
-        for algo in algorithms:
-            arm_val = df[(df['architecture'] == 'ARM64') & 
-                        (df['algorithm'] == algo) & 
-                        (df['operation'] == op)]['mean_us'].values[0]
-            riscv_val = df[(df['architecture'] == 'RISC-V64') & 
-                          (df['algorithm'] == algo) & 
-                          (df['operation'] == op)]['mean_us'].values[0]
-            advantage = ((riscv_val - arm_val) / riscv_val) * 100
-            advantages.append(advantage)
+        family_advantage = advantage[family_rows(family)]
+        for i, op in enumerate(family['operations']):
+            ax.bar(x + i*width, family_advantage[:, i], width, label=op.capitalize())
         
-        bars = ax.bar(x + i*width, advantages, width, label=op.capitalize())
-    
-    ax.set_xlabel('Algorithm')
-    ax.set_ylabel('ARM64 Advantage (%)')
-    ax.set_title('ML-DSA: ARM64 Advantage over RISC-V64')
-    ax.set_xticks(x + width)
-    ax.set_xticklabels(['44', '65', '87'])
-    ax.legend()
-    ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
-    ax.set_ylim(-30, 30)
+        ax.set_xlabel('Algorithm')
+        ax.set_ylabel('ARM64 Advantage (%)')
+        ax.set_title(f"{family['title']}: ARM64 Advantage over RISC-V64")
+        ax.set_xticks(x + width)
+        ax.set_xticklabels(family['levels'])
+        ax.legend()
+        ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
+        ax.set_ylim(-30, 30)
     
-    plt.suptitle('Comparación ARM64 vs RISC-V64 (under QEMU)', fontsize=14, fontweight='bold')
-    plt.tight_layout()
+    fig.suptitle('Comparación ARM64 vs RISC-V64 (under QEMU)', fontsize=14, fontweight='bold')
     
     # Guardar
-    for fmt in ['png', 'pdf']:
-        fig.savefig(OUTPUT_DIR / f'arm_vs_riscv.{fmt}', dpi=300, bbox_inches='tight')
-        fig.savefig(THESIS_DIR / f'arm_vs_riscv.{fmt}', dpi=300, bbox_inches='tight')
+    save_figure(fig, 'arm_vs_riscv')
     
-    plt.close()
-    print(f"   Saved: arm_vs_riscv.png/pdf")
+    print(f"   Saved: arm_vs_riscv.{'/'.join(FORMATS)}")
 
 
-def plot_security_level_scaling(df):
+def plot_security_level_scaling(aggregates):
     """Genera gráfica de escalamiento por nivel de seguridad."""
     print("\n Generating chart de escalamiento...")
+    if not has_data(aggregates, ALL_ALGORITHMS):
+        return
     
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    algo_mean_us = aggregates['algo_mean_us']
     
-    # ML-KEM
-    ax = axes[0]
-    levels = [512, 768, 1024]
+    fig, axes = get_figure(1, 2, (12, 5))
     
-    for arch in ['x86_64', 'ARM64', 'RISC-V64']:
-        means = []
-        for level in levels:
-            algo = f'ML-KEM-{level}'
-            mean = df[(df['architecture'] == arch) & (df['algorithm'] == algo)]['mean_us'].mean()
-            means.append(mean)
+    for ax, family in zip(axes, FAMILIES.values()):
+        levels = [int(level) for level in family['levels']]
+        level_means = algo_mean_us[:, family_rows(family)]
         
-        ax.plot(levels, means, 'o-', label=arch, color=COLORS[arch], linewidth=2, markersize=8)
-    
-    ax.set_xlabel('Security Level (ML-KEM)')
-    ax.set_ylabel('Time Promedio (µs)')
-    ax.set_title('ML-KEM: Scaling by Level')
-    ax.legend()
-    ax.set_yscale('log')
-    ax.set_xticks(levels)
-    
-    # ML-DSA
-    ax = axes[1]
-    levels = [44, 65, 87]
-    
-    for arch in ['x86_64', 'ARM64', 'RISC-V64']:
-        means = []
-        for level in levels:
-            algo = f'ML-DSA-{level}'
-            mean = df[(df['architecture'] == arch) & (df['algorithm'] == algo)]['mean_us'].mean()
-            means.append(mean)
+        for arch, means in zip(ARCHITECTURES, level_means):
+            ax.plot(levels, log10_values(means), 'o-', label=arch, color=COLORS[arch],
+                    linewidth=2, markersize=8)
         
-        ax.plot(levels, means, 'o-', label=arch, color=COLORS[arch], linewidth=2, markersize=8)
-    
-    ax.set_xlabel('Security Level (ML-DSA)')
-    ax.set_ylabel('Time Promedio (µs)')
-    ax.set_title('ML-DSA: Scaling by Level')
-    ax.legend()
-    ax.set_yscale('log')
-    ax.set_xticks(levels)
+        ax.set_xlabel(f"Security Level ({family['title']})")
+        ax.set_ylabel('Time Promedio (µs)')
+        ax.set_title(f"{family['title']}: Scaling by Level")
+        ax.legend()
+        set_log10_yaxis(ax)
+        ax.set_xticks(levels)
     
-    plt.suptitle('Escalamiento del Time de Ejecución por Security Level', fontsize=14, fontweight='bold')
-    plt.tight_layout()
+    fig.suptitle('Escalamiento del Time de Ejecución por Security Level',
+                 fontsize=14, fontweight='bold')
     
     # Guardar
-    for fmt in ['png', 'pdf']:
-        fig.savefig(OUTPUT_DIR / f'security_scaling.{fmt}', dpi=300, bbox_inches='tight')
-        fig.savefig(THESIS_DIR / f'security_scaling.{fmt}', dpi=300, bbox_inches='tight')
+    save_figure(fig, 'security_scaling')
     
-    plt.close()
-    print(f"   Saved: security_scaling.png/pdf")
+    print(f"   Saved: security_scaling.{'/'.join(FORMATS)}")
 
 
-def plot_operation_comparison(df):
+def plot_operation_comparison(aggregates):
     """Genera gráfica de comparación de operaciones."""
     print("\n Generating chart de operaciones...")
+    if not has_data(aggregates, ALL_ALGORITHMS):
+        return
     
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    mean_us = aggregates['mean_us']
     
-    # ML-KEM - Costo relativo vs KeyGen
-    ax = axes[0]
-    algorithms = ['ML-KEM-512', 'ML-KEM-768', 'ML-KEM-1024']
-    x = np.arange(len(algorithms))
-    width = 0.25
+    fig, axes = get_figure(1, 2, (12, 5))
     
-    for i, arch in enumerate(['x86_64', 'ARM64', 'RISC-V64']):
-        encaps_ratios = []
-        decaps_ratios = []
-        
-        for algo in algorithms:
-            arch_data = df[(df['architecture'] == arch) & (df['algorithm'] == algo)]
-            keygen = arch_data[arch_data['operation'] == 'keygen']['mean_us'].values[0]
-            encaps = arch_data[arch_data['operation'] == 'encaps']['mean_us'].values[0]
-            decaps = arch_data[arch_data['operation'] == 'decaps']['mean_us'].values[0]
-            
-            encaps_ratios.append(encaps / keygen)
-            decaps_ratios.append(decaps / keygen)
-        
-        ax.bar(x + i*width - width, encaps_ratios, width/2, label=f'{arch} Encaps', alpha=0.7)
-        ax.bar(x + i*width - width/2, decaps_ratios, width/2, label=f'{arch} Decaps', alpha=0.7)
-    
-    ax.set_xlabel('Algorithm')
-    ax.set_ylabel('Ratio vs KeyGen')
-    ax.set_title('ML-KEM: Relative Operation Cost')
-    ax.set_xticks(x)
-    ax.set_xticklabels(['512', '768', '1024'])
-    ax.axhline(y=1, color='gray', linestyle='--', alpha=0.5)
-    ax.legend(loc='upper left', fontsize=8)
-    
-    # ML-DSA - Costo relativo vs KeyGen
-    ax = axes[1]
-    algorithms = ['ML-DSA-44', 'ML-DSA-65', 'ML-DSA-87']
-    x = np.arange(len(algorithms))
+    width = 0.25
     
-    for i, arch in enumerate(['x86_64', 'ARM64', 'RISC-V64']):
-        sign_ratios = []
-        verify_ratios = []
+    # Costo relativo vs KeyGen (the first operation of each family)
+    for ax, family in zip(axes, FAMILIES.values()):
+        algorithms = family['algorithms']
+        x = np.arange(len(algorithms))
+        first_title, second_title = family['op_titles'][1:]
         
-        for algo in algorithms:
-            arch_data = df[(df['architecture'] == arch) & (df['algorithm'] == algo)]
-            keygen = arch_data[arch_data['operation'] == 'keygen']['mean_us'].values[0]
-            sign = arch_data[arch_data['operation'] == 'sign']['mean_us'].values[0]
-            verify = arch_data[arch_data['operation'] == 'verify']['mean_us'].values[0]
+        for i, arch in enumerate(ARCHITECTURES):
+            keygen, first, second = mean_us[i, family_rows(family), :].T
             
-            sign_ratios.append(sign / keygen)
-            verify_ratios.append(verify / keygen)
+            ax.bar(x + i*width - width, first / keygen, width/2,
+                   label=f'{arch} {first_title}', alpha=0.7)
+            ax.bar(x + i*width - width/2, second / keygen, width/2,
+                   label=f'{arch} {second_title}', alpha=0.7)
         
-        ax.bar(x + i*width - width, sign_ratios, width/2, label=f'{arch} Sign', alpha=0.7)
-        ax.bar(x + i*width - width/2, verify_ratios, width/2, label=f'{arch} Verify', alpha=0.7)
-    
-    ax.set_xlabel('Algorithm')
-    ax.set_ylabel('Ratio vs KeyGen')
-    ax.set_title('ML-DSA: Relative Operation Cost')
-    ax.set_xticks(x)
-    ax.set_xticklabels(['44', '65', '87'])
-    ax.axhline(y=1, color='gray', linestyle='--', alpha=0.5)
-    ax.legend(loc='upper left', fontsize=8)
+        ax.set_xlabel('Algorithm')
+        ax.set_ylabel('Ratio vs KeyGen')
+        ax.set_title(f"{family['title']}: Relative Operation Cost")
+        ax.set_xticks(x)
+        ax.set_xticklabels(family['levels'])
+        ax.axhline(y=1, color='gray', linestyle='--', alpha=0.5)
+        ax.legend(loc='upper left', fontsize=8)
     
-    plt.suptitle('Relative Operation Cost (vs KeyGen = 1.0)', fontsize=14, fontweight='bold')
-    plt.tight_layout()
+    fig.suptitle('Relative Operation Cost (vs KeyGen = 1.0)', fontsize=14, fontweight='bold')
     
     # Guardar
-    for fmt in ['png', 'pdf']:
-        fig.savefig(OUTPUT_DIR / f'operation_comparison.{fmt}', dpi=300, bbox_inches='tight')
-        fig.savefig(THESIS_DIR / f'operation_comparison.{fmt}', dpi=300, bbox_inches='tight')
+    save_figure(fig, 'operation_comparison')
     
-    plt.close()
-    print(f"   Saved: operation_comparison.png/pdf")
+    print(f"   Saved: operation_comparison.{'/'.join(FORMATS)}")
 
 
-def plot_summary_heatmap(df):
+def plot_summary_heatmap(aggregates):
     """Generate performance summary heatmap."""
     print("\n Generating performance heatmap...")
+    if not has_data(aggregates, ALL_ALGORITHMS):
+        return
     
     # Create data matrix
-    algorithms = ['ML-KEM-512', 'ML-KEM-768', 'ML-KEM-1024', 
-                  'ML-DSA-44', 'ML-DSA-65', 'ML-DSA-87']
-    architectures = ['x86_64', 'ARM64', 'RISC-V64']
-    
-    data = np.zeros((len(algorithms), len(architectures)))
-    
-    for i, algo in enumerate(algorithms):
-        for j, arch in enumerate(architectures):
-            mean = df[(df['architecture'] == arch) & (df['algorithm'] == algo)]['mean_us'].mean()
-            data[i, j] = mean
+    algorithms = ALL_ALGORITHMS
+    architectures = ARCHITECTURES
     
-    # Normalize by row (algoritmo)
-    data_norm = data / data[:, 0:1]  # Normalizar vs x86_64
+    # Normalized by row (algoritmo) vs x86_64; already in plotting order
+    data_norm = aggregates['overhead'].to_numpy()
     
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig, ax = get_figure(1, 1, (8, 6))
     
-    im = ax.imshow(data_norm, cmap='RdYlGn_r', aspect='auto')
+    # No resampling: Agg upsamples nearest-neighbour, PDF embeds the 3x6 cells as-is
+    im = ax.imshow(data_norm, cmap='RdYlGn_r', aspect='auto', interpolation='none')
     
     # Labels
     ax.set_xticks(np.arange(len(architectures)))
@@ -506,11 +576,11 @@ def plot_summary_heatmap(df):
     # Rotate labels
     plt.setp(ax.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
     
-    # Add values
-    for i in range(len(algorithms)):
-        for j in range(len(architectures)):
-            text = ax.text(j, i, f'{data_norm[i, j]:.1f}×',
-                          ha="center", va="center", color="black", fontsize=10)
+    # Add values (one pass over the matrix, one Text per cell; missing cells stay blank)
+    for (i, j), value in np.ndenumerate(data_norm):
+        if np.isnan(value):
+            continue
+        ax.text(j, i, f'{value:.1f}×', ha="center", va="center", color="black", fontsize=10)
     
     ax.set_title('Overhead Relativo vs Native x86_64\n(1.0× = equal performance)', fontsize=12)
     
@@ -518,15 +588,45 @@ def plot_summary_heatmap(df):
     cbar = ax.figure.colorbar(im, ax=ax)
     cbar.ax.set_ylabel('Overhead (×)', rotation=-90, va="bottom")
     
-    plt.tight_layout()
-    
     # Guardar
-    for fmt in ['png', 'pdf']:
-        fig.savefig(OUTPUT_DIR / f'performance_heatmap.{fmt}', dpi=300, bbox_inches='tight')
-        fig.savefig(THESIS_DIR / f'performance_heatmap.{fmt}', dpi=300, bbox_inches='tight')
+    save_figure(fig, 'performance_heatmap')
     
-    plt.close()
-    print(f"   Saved: performance_heatmap.png/pdf")
+    print(f"   Saved: performance_heatmap.{'/'.join(FORMATS)}")
+
+
+# Independent figures, generated in parallel by main()
+PLOT_FUNCTIONS = (
+    partial(plot_family_comparison, family=FAMILIES['mlkem']),
+    partial(plot_family_comparison, family=FAMILIES['mldsa']),
+    plot_architecture_overhead,
+    plot_arm_vs_riscv,
+    plot_security_level_scaling,
+    plot_operation_comparison,
+    plot_summary_heatmap,
+)
+
+# Aggregates shared by all plots in a worker process (set by _init_worker)
+_worker_aggregates = None
+
+
+def _init_worker(aggregates):
+    """Receive the aggregates once per worker process instead of once per task."""
+    global _worker_aggregates
+    _worker_aggregates = aggregates
+
+
+def _run_plot(plot_func):
+    """Run one plot function in a worker, returning its console output.
+    
+    A failing plot is reported in its output instead of aborting the others.
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        try:
+            plot_func(_worker_aggregates)
+        except Exception as e:
+            print(f"   Failed: {type(e).__name__}: {e}")
+    return buffer.getvalue()
 
 
 def main():
@@ -538,15 +638,23 @@ def main():
     
     # Load data
     df = load_data()
-    
-    # Generate figures
-    plot_mlkem_comparison(df)
-    plot_mldsa_comparison(df)
-    plot_architecture_overhead(df)
-    plot_arm_vs_riscv(df)
-    plot_security_level_scaling(df)
-    plot_operation_comparison(df)
-    plot_summary_heatmap(df)
+    if df.empty:
+        print(" No data to plot; skipping figure generation")
+        return
+    aggregates = preprocess(df)
+    
+    # Generate figures (one process per figure; output printed in order)
+    max_workers = min(len(PLOT_FUNCTIONS), os.cpu_count() or 1)
+    if max_workers == 1:
+        # Single core: a worker process would only add startup and pickling cost
+        _init_worker(aggregates)
+        for output in map(_run_plot, PLOT_FUNCTIONS):
+            print(output, end='')
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(aggregates,)) as executor:
+            for output in executor.map(_run_plot, PLOT_FUNCTIONS):
+                print(output, end='')
     
     print("\n" + "="*60)
     print(" FIGURES GENERATED")
@@ -0,0 +1,70 @@
+"""
+Tests for scripts/validate_data.py: the pandas column-wise CSV checks must
+give the same verdict as the row-by-row checks, malformed files included.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+from validate_data import CSVValidator  # noqa: E402
+
+pytest.importorskip("pandas")
+
+HEADER = "algorithm,operation,iterations,mean,median\n"
+
+CASES = {
+    "valid": HEADER + "ML-KEM-512,keygen,10,1.5,2\n",
+    "short_row": HEADER + "ML-KEM-512,keygen,10,1.5,2\nML-KEM-512,keygen,10\n",
+    "long_row": HEADER + "ML-KEM-512,keygen,10,1.5,2\nML-KEM-512,keygen,10,1.5,2,extra\n",
+    "long_rows": HEADER + "ML-KEM-512,keygen,10,1.5,2,x\nML-KEM-512,sign,10,-1,2,y\n",
+    "empty_fields": HEADER + "ML-KEM-512,,10,,2\n ,keygen,10,1,2\n",
+    "numbers": HEADER + "a,k,1_000,nan,-inf\na,k,abc,+NaN,1e3\na,k, -2 ,inf,0x10\n",
+    "blank_lines": HEADER + "a,k,10,1.5,2\n\n\na,k,-1,1,1\n",
+    "whitespace_line": HEADER + "a,k,10,1.5,2\n   \n",
+    "duplicate_header": "algorithm,operation,mean,mean\na,k,-1,2\n",
+    "crlf": HEADER.replace("\n", "\r\n") + "a,,10,-1,x\r\n",
+}
+
+
+def validate(path, vectorized):
+    validator = CSVValidator()
+    validator.VECTORIZED_MIN_SIZE = 0 if vectorized else float("inf")
+    result = validator.validate(str(path))
+    return result.valid, result.errors, result.warnings
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_vectorized_rows_match_row_by_row(tmp_path, name):
+    path = tmp_path / f"{name}.csv"
+    path.write_bytes(CASES[name].encode())
+    assert validate(path, vectorized=True) == validate(path, vectorized=False)
+
+
+def test_vectorized_rejects_ragged_rows():
+    validator = CSVValidator()
+    headers = HEADER.strip().split(",")
+    for name in ("short_row", "long_row", "whitespace_line"):
+        with pytest.raises(ValueError):
+            validator._check_rows_vectorized(CASES[name].encode(), headers)
+
+
+def test_vectorized_flags_empty_fields():
+    validator = CSVValidator()
+    errors, row_count = validator._check_rows_vectorized(
+        CASES["empty_fields"].encode(), HEADER.strip().split(","))
+    assert row_count == 2
+    assert len(errors) == 2
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_result_errors_are_strings(tmp_path, vectorized):
+    path = tmp_path / "empty_fields.csv"
+    path.write_bytes(CASES["empty_fields"].encode())
+    valid, errors, _ = validate(path, vectorized)
+    assert not valid
+    assert errors == ["Row 2: Empty value in column 'operation'",
+                      "Row 3: Empty value in column 'algorithm'"]
@@ -3,28 +3,59 @@
 
 import hashlib
 import json
+import mmap
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def calculate_sha256(file_path):
-    sha256_hash = hashlib.sha256()
+def get_hasher(algorithm):
+    if algorithm == "blake3":
+        import blake3
+        return blake3.blake3
+    return getattr(hashlib, algorithm)
+
+
+# Files at least this large are hashed from a memory map, 16 MiB per update
+MMAP_MIN_SIZE = 64 << 20
+MMAP_UPDATE_SIZE = 16 << 20
+
+
+def digest_mmap(f, hasher):
+    file_hash = hasher()
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise"):
+            try:
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            except (AttributeError, OSError):
+                pass
+        with memoryview(mm) as view:
+            for offset in range(0, len(view), MMAP_UPDATE_SIZE):
+                file_hash.update(view[offset:offset + MMAP_UPDATE_SIZE])
+    return file_hash.hexdigest()
+
+
+def calculate_digest(file_path, algorithm="sha256"):
+    hasher = get_hasher(algorithm)
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(65536), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            return digest_mmap(f, hasher)
+        return hashlib.file_digest(f, hasher).hexdigest()
 
 
 def verify_checksums(manifest_file, data_dir):
     with open(manifest_file) as f:
         manifest = json.load(f)
     
+    algorithm = manifest.get("algorithm", "sha256")
+    
     # Support both formats: {"checksums": {...}} and {"files": {...}}
     if "checksums" in manifest:
         checksums = manifest["checksums"]
     elif "files" in manifest:
         # Convert simple format to expected format
-        checksums = {path: {"sha256": checksum} for path, checksum in manifest["files"].items()}
+        checksums = {path: {algorithm: checksum} for path, checksum in manifest["files"].items()}
     else:
         print("Error: Invalid manifest format")
         sys.exit(1)
@@ -35,24 +66,38 @@ def verify_checksums(manifest_file, data_dir):
     
     print(f"Verifying {total} files...")
     
-    for rel_path, info in checksums.items():
+    def check(item):
+        rel_path, info = item
         file_path = data_dir / rel_path
-        
-        if not file_path.exists():
-            print(f"✗ Missing: {rel_path}")
-            failed.append((rel_path, "missing"))
-            continue
-        
-        actual_checksum = calculate_sha256(file_path)
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            return rel_path, "missing"
+        # A size differing from the manifest is a guaranteed checksum
+        # mismatch: reported without reading the file
+        if isinstance(info, dict) and "size" in info and size != info["size"]:
+            return rel_path, "size mismatch"
+        actual_checksum = calculate_digest(file_path, algorithm)
         # Handle both dict and string formats
-        expected_checksum = info["sha256"] if isinstance(info, dict) else info
-        
-        if actual_checksum == expected_checksum:
-            verified += 1
-            print(f"✓ {rel_path}")
-        else:
-            print(f"✗ Checksum mismatch: {rel_path}")
-            failed.append((rel_path, "mismatch"))
+        expected_checksum = info[algorithm] if isinstance(info, dict) else info
+        return rel_path, None if actual_checksum == expected_checksum else "mismatch"
+    
+    # Files are hashed concurrently (hashing releases the GIL); results are
+    # reported in manifest order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for rel_path, problem in executor.map(check, checksums.items()):
+            if problem is None:
+                verified += 1
+                print(f"✓ {rel_path}")
+            elif problem == "missing":
+                print(f"✗ Missing: {rel_path}")
+                failed.append((rel_path, problem))
+            elif problem == "size mismatch":
+                print(f"✗ Size mismatch: {rel_path}")
+                failed.append((rel_path, problem))
+            else:
+                print(f"✗ Checksum mismatch: {rel_path}")
+                failed.append((rel_path, problem))
     
     print(f"\nResults: {verified}/{total} verified")
     